@@ -1,31 +1,214 @@
+import functools
+import hashlib
+import io
 import logging
+import os
+import queue
+import threading
 import tkinter as tk
-
-from PIL import Image, ImageTk
+from dataclasses import dataclass
 from pathlib import Path
-from pythonjsonlogger.json import JsonFormatter
 
-logger = logging.getLogger()
-logger.setLevel(logging.INFO)
-log_handler = logging.StreamHandler()
-formatter = JsonFormatter()
-log_handler.setFormatter(formatter)
-if not logger.handlers:
-    logger.addHandler(log_handler)
+from PIL import Image
+
+# Optional SIMD resizer, see the "display" extra. 4.x installs it as cykooz_resizer, earlier releases as
+# cykooz.resizer, with the same API.
+try:
+    from cykooz_resizer import FilterType, ResizeAlg, Resizer, ResizeOptions
+except ImportError:
+    try:
+        from cykooz.resizer import FilterType, ResizeAlg, Resizer, ResizeOptions
+    except ImportError:
+        Resizer = None
+
+# Handlers are configured by the application, importing the GUI must not touch them
+logger = logging.getLogger(__name__)
+
+# Sizes the album art is pre-scaled to once per song
+PYRAMID_SIZES = (256, 512, 1024)
+
+# Rendered album art is also kept on disk, since songs and albums come round again
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or "~/.cache").expanduser() / "tunedisplay"
+RENDER_CACHE_DIR = CACHE_DIR / "rendered"
+RENDER_CACHE_MAX_BYTES = 200 * 1024 * 1024
+
+# A single resizer reuses its internal buffers between calls
+if Resizer:
+    _resizer = Resizer()
+    _resize_options = ResizeOptions(resize_alg=ResizeAlg.convolution(FilterType.lanczos3))
+else:
+    _resizer = _resize_options = None
+
+
+def _fit_size(size, box):
+    """Scale a (width, height) so its longest side is box, maintaining aspect ratio"""
+    width, height = size
+    if width > height:
+        return box, int(height * (box / width))
+    return int(width * (box / height)), box
+
+
+def _resize(img, size, resample):
+    """Resize an image, using the SIMD resizer when it is installed"""
+    if _resizer and img.mode in ("RGB", "RGBA"):
+        dst = Image.new(img.mode, size)
+        _resizer.resize_pil(img, dst, _resize_options)
+        return dst
+
+    # When shrinking, let Pillow box-average by an integer factor first (like OpenCV's
+    # INTER_AREA) so the filter only has a small final step to do
+    reducing_gap = 2.0 if size[0] < img.width else None
+    return img.resize(size, resample, reducing_gap=reducing_gap)
+
+
+def _to_ppm(img):
+    """Encode an image as binary PPM, which Tk can load without going through ImageTk"""
+    if img.mode != "RGB":
+        img = img.convert("RGB")
+    buf = io.BytesIO()
+    img.save(buf, "PPM")
+    return buf.getvalue()
+
+
+@functools.lru_cache(maxsize=1)
+def _load_source(image_path, mtime_ns, max_size):
+    """Decode the album art once, no larger than max_size, so resizes don't hit the disk again"""
+    # mtime_ns is only part of the cache key so a rewritten file is not served stale
+    with Image.open(image_path) as img:
+        # Called before any pixel access, thumbnail lets JPEGs decode straight at a reduced
+        # scale (draft mode) rather than decoding full size art that never gets displayed
+        img.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
+        # Force the full decode now; the pixels stay usable once the file is closed
+        img.load()
+
+    # Palette, greyscale or alpha art would otherwise be converted again on every resize
+    # and PPM encode; plain RGB is also what the SIMD resize kernels are fastest on
+    if img.mode != "RGB":
+        img = img.convert("RGB")
+    return img
+
+
+@functools.lru_cache(maxsize=1)
+def _load_pyramid(image_path, mtime_ns, max_size):
+    """Pre-scale the album art to a few sizes, smallest first, ending with the original"""
+    img = _load_source(image_path, mtime_ns, max_size)
+
+    # High quality filtering is paid once per song; later resizes only need a short cheap step
+    pyramid = []
+    for tier_size in PYRAMID_SIZES:
+        if tier_size >= max(img.size):
+            break
+        # Resize straight from the source rather than copying it first
+        tier_dims = _fit_size(img.size, tier_size)
+        pyramid.append(img.resize(tier_dims, Image.Resampling.LANCZOS, reducing_gap=3.0))
+    pyramid.append(img)
+    return pyramid
+
+
+def _render_art(image_path, mtime_ns, art_size, max_size, resample):
+    """Resize album art to fit art_size"""
+    pyramid = _load_pyramid(image_path, mtime_ns, max_size)
+    img = pyramid[-1]
+
+    new_size = _fit_size(img.size, art_size)
+
+    # Start from the smallest pre-scaled tier that is still big enough
+    tier = next((t for t in pyramid if max(t.size) >= art_size), img)
+    if tier.size != new_size:
+        tier = _resize(tier, new_size, resample)
+
+    return tier
+
+
+def _ppm_size(data):
+    """Read (width, height) from a binary PPM header"""
+    _, width, height = data.split(maxsplit=3)[:3]
+    return int(width), int(height)
+
+
+def _trim_render_cache():
+    """Delete the least recently used rendered art until the cache fits its budget"""
+    entries = []
+    for path in RENDER_CACHE_DIR.glob("*.ppm"):
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((st.st_mtime_ns, st.st_size, path))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= RENDER_CACHE_MAX_BYTES:
+            break
+        path.unlink(missing_ok=True)
+        total -= size
+
+
+@functools.lru_cache(maxsize=16)
+def _render_ppm(image_path, mtime_ns, art_size, max_size, resample):
+    """Album art resized to fit art_size as PPM data and its size, cached in memory and on disk"""
+    # Downloaded art is named after its URL and never rewritten, so path and mtime identify the cover
+    key = f"{image_path}|{mtime_ns}|{art_size}|{max_size}|{resample.name}"
+    cache_path = RENDER_CACHE_DIR / f"{hashlib.sha256(key.encode()).hexdigest()[:16]}.ppm"
+
+    try:
+        data = cache_path.read_bytes()
+        # Bump the mtime so trimming keeps recently shown art
+        os.utime(cache_path)
+    except OSError:
+        pass
+    else:
+        return data, _ppm_size(data)
+
+    img = _render_art(image_path, mtime_ns, art_size, max_size, resample)
+    data = _to_ppm(img)
+
+    try:
+        RENDER_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Write then rename so a reader never sees a half written file
+        tmp_path = cache_path.with_suffix(".part")
+        tmp_path.write_bytes(data)
+        tmp_path.replace(cache_path)
+    except OSError:
+        logger.warning("Could not write rendered album art cache %s", cache_path, exc_info=True)
+
+    return data, img.size
+
+
+@dataclass(frozen=True)
+class GuiConfig:
+    """Appearance and rendering options for TuneDisplayGUI"""
+
+    fullscreen: bool = True
+    bg_color: str = "#2a2a2a"  # Black
+    fg_color: str = "#f6f2f2"  # White
+    # Transparency (0.0 is fully transparent, 1.0 is opaque)
+    alpha: float = 0.55
+    # Filter for the Pillow resize fallback. Bilinear costs about the same as nearest
+    # on small RGB art but avoids the blocky look.
+    resample: Image.Resampling = Image.Resampling.BILINEAR
+
 
 class TuneDisplayGUI:
-    def __init__(self):
+    def __init__(self, config=None):
         # Create the main window
         logger.info("Initializing TuneDisplayGUI")
+        self.config = config or GuiConfig()
         self.root = tk.Tk()
         self.root.title("TuneDisplay")
 
-        # Don't show the mouse cursor
-        self.root.config(cursor="none")
+        bg_color = self.config.bg_color
+        fg_color = self.config.fg_color
 
-        # Make window stay on top
-        self.root.attributes('-topmost', True)
-        self.root.attributes('-fullscreen', True)
+        # Don't show the mouse cursor, set the background in the same call
+        self.root.configure(cursor="none", bg=bg_color)
+
+        # Stay on top, go fullscreen and set the transparency in a single Tcl call
+        self.root.attributes(
+            '-topmost', True,
+            '-fullscreen', self.config.fullscreen,
+            '-alpha', self.config.alpha,
+        )
 
         # Add escape key binding to exit fullscreen
         self.root.bind("<Escape>", lambda event: self.toggle_fullscreen())
@@ -33,14 +216,6 @@ class TuneDisplayGUI:
         # Set window size (width x height)
         self.root.geometry("600x600")
 
-        # Set background color to black
-        bg_color = "#2a2a2a"  # Black
-        fg_color = "#f6f2f2"  # White
-        # Add transparency (0.0 is fully transparent, 1.0 is opaque)
-        self.root.attributes('-alpha', 0.55)
-
-        self.root.configure(bg=bg_color)
-
         # Create a main container frame
         main_frame = tk.Frame(self.root, bg=bg_color)
         main_frame.pack(fill=tk.BOTH, expand=True, padx=3, pady=5)
@@ -96,8 +271,9 @@ class TuneDisplayGUI:
         # Keep a reference to the PhotoImage to prevent garbage collection
         self.current_image = None
 
-        # Flag to track if we're running
+        # Flag to track if we're running, and an event other threads can wait on for shutdown
         self.running = True
+        self.stop_event = threading.Event()
 
         # Bind resize event to update album art when window size changes
         self.root.bind("<Configure>", self.on_resize)
@@ -105,91 +281,156 @@ class TuneDisplayGUI:
         # Store the current image path for resize events
         self.current_image_path = None
 
+        # Pending debounced resize callback and the size it will use
+        self._resize_after_id = None
+        self._pending_size = None
+
+        # File version and size of the album art currently shown
+        self._last_art_key = None
+
+        # The art is never shown larger than the screen, so never decode it any larger either
+        self._max_art_size = max(self.root.winfo_screenwidth(), self.root.winfo_screenheight())
+
+        # Decoding and resizing run on a worker so they never block the Tk main loop.
+        # The queue holds a single job: a newer request replaces one that hasn't started yet.
+        self._art_queue = queue.Queue(maxsize=1)
+        self._art_queue_lock = threading.Lock()
+        threading.Thread(target=self._art_worker, name="album-art", daemon=True).start()
+
     def on_resize(self, event):
         """Handle window resize events"""
         # Only process resize events for the root window
         if event.widget == self.root and self.current_image_path:
-            # Add a small delay to avoid too many updates
-            self.root.after(100, lambda: self.update_album_art(self.current_image_path))
+            # The event already carries the new size, no need to ask Tk for it again
+            self._pending_size = (event.width, event.height)
+
+            # Collapse a burst of resize events into a single update once they settle
+            if self._resize_after_id:
+                self.root.after_cancel(self._resize_after_id)
+            self._resize_after_id = self.root.after(100, self._do_resize)
+
+    def _do_resize(self):
+        """Redraw the album art once the window size has settled"""
+        self._resize_after_id = None
+        if not self.current_image_path:
+            return
+        # update_album_art skips the render when this height is already on display
+        self.update_album_art(self.current_image_path, art_size=self._pending_size[1])
 
     def toggle_fullscreen(self):
         """Toggle between fullscreen and windowed mode"""
         is_fullscreen = self.root.attributes('-fullscreen')
         self.root.attributes('-fullscreen', not is_fullscreen)
 
-    def update_album_art(self, image_path):
-        """Update the displayed album art"""
-        if not self.running or not Path(image_path).exists():
+    def update_album_art(self, image_path, art_size=None):
+        """Update the displayed album art, sized to art_size or the window height"""
+        if not self.running:
+            return
+
+        # One stat call both checks the file exists and versions it for the caches
+        try:
+            mtime_ns = os.stat(image_path).st_mtime_ns
+        except FileNotFoundError:
             return
 
         # Store the current image path for resize events
         self.current_image_path = image_path
 
         try:
-            logger.info(f"Updating album art with: {image_path}")
-
-            # Open the image
-            img = Image.open(image_path)
-
-            # Get the current height of the window
-            window_height = self.root.winfo_height()
+            logger.info("Updating album art with: %s", image_path)
 
             # Use the full height of the window for the art
-            art_size = window_height
-
-            # Calculate new size while maintaining aspect ratio
-            width, height = img.size
-            if width > height:
-                new_width = art_size
-                new_height = int(height * (art_size / width))
-            else:
-                new_height = art_size
-                new_width = int(width * (art_size / height))
-
-            # Use simpler image resizing for better performance on Raspberry Pi
-            img = img.resize((new_width, new_height), Image.Resampling.NEAREST)
-
-            # Convert to PhotoImage and keep a reference
-            photo = ImageTk.PhotoImage(img)
-            self.current_image = photo  # Keep reference to prevent garbage collection
-
-            # Update the label on the main thread
-            self.root.after(0, lambda: self.art_label.config(image=self.current_image))
+            if art_size is None:
+                art_size = self.root.winfo_height()
+
+            # Nothing to do if the label already shows this file at this size
+            art_key = (image_path, mtime_ns, art_size)
+            if art_key == self._last_art_key:
+                return
+            self._last_art_key = art_key
+
+            with self._art_queue_lock:
+                try:
+                    self._art_queue.get_nowait()  # Drop a stale job that hasn't started yet
+                except queue.Empty:
+                    pass
+                self._art_queue.put_nowait(art_key)
+
+        except Exception:
+            logger.exception("Error updating album art")
+
+    def _art_worker(self):
+        """Render queued album art jobs off the Tk thread"""
+        # Trimming lists the whole cache, so do it once a run rather than on every write
+        try:
+            _trim_render_cache()
+        except OSError:
+            logger.warning("Could not trim rendered album art cache", exc_info=True)
+
+        while True:
+            art_key = self._art_queue.get()
+            try:
+                data, size = _render_ppm(*art_key, self._max_art_size, self.config.resample)
+            except Exception:
+                logger.exception("Error rendering album art")
+                continue
+            self.root.after(0, self._install_art, art_key, data, size)
+
+    def _install_art(self, art_key, data, size):
+        """Show rendered album art PPM data, on the Tk thread"""
+        # A newer song or size was requested while this one was rendering
+        if not self.running or art_key != self._last_art_key:
+            return
 
-        except Exception as e:
-            logger.exception(f"Error updating album art: {e}")
+        # Tk leaks memory when a label keeps being given new images, so create one image
+        # and reload it with the new data, whatever its size
+        if self.current_image is None:
+            self.current_image = tk.PhotoImage(master=self.root)
+        width, height = size
+        self.current_image.configure(data=data, format="ppm", width=width, height=height)
+        self.art_label.config(image=self.current_image)
 
     def update_song_info(self, title="", artist="", album=""):
         """Update the displayed song information with separate fields"""
         if not self.running:
             return
 
-        logger.info(f"Updating GUI with: {title} - {artist} - {album}")
+        logger.info("Updating GUI with: %s - %s - %s", title, artist, album)
 
-        # Use after to schedule the updates on the main thread
         if not title and not artist and not album:
             # Not playing anything
-            self.root.after(0, lambda: self.title_label.config(text="Currently not playing anything"))
-            self.root.after(0, lambda: self.artist_label.config(text=""))
-            self.root.after(0, lambda: self.album_label.config(text=""))
-        else:
-            self.root.after(0, lambda: self.title_label.config(text=title))
-            self.root.after(0, lambda: self.artist_label.config(text=artist))
-            self.root.after(0, lambda: self.album_label.config(text=f"{album}" if album else ""))
+            title = "Currently not playing anything"
+
+        # Use a single after to apply all three updates in one pass on the main thread
+        self.root.after(0, self._apply_song, title, artist, album)
+
+    def _apply_song(self, title, artist, album):
+        """Set the song labels, on the Tk thread"""
+        self.title_label.config(text=title)
+        self.artist_label.config(text=artist)
+        self.album_label.config(text=album)
 
     def clear_album_art(self):
         """Clear the album art"""
         if self.running:
-            self.current_image = None
+            # The PhotoImage itself is kept so the next song's art can reuse it
+            self.current_image_path = None
+            self._last_art_key = None
+            # The song changed, so none of the cached sizes will be needed again
+            _render_ppm.cache_clear()
+            _load_pyramid.cache_clear()
+            _load_source.cache_clear()
             self.root.after(0, lambda: self.art_label.config(image=''))
 
     def start(self):
         """Start the GUI main loop"""
         self.root.mainloop()
         self.running = False  # Set flag when mainloop exits
+        self.stop_event.set()
 
     def close(self):
         """Close the window"""
         self.running = False
+        self.stop_event.set()
         self.root.quit()
         self.root.destroy()
@@ -1,38 +1,149 @@
 """Gather the current playing song from last.fm and display it."""
 
 import argparse
+import dataclasses
+import functools
+import hashlib
 import importlib.metadata
-import json
 import logging
 import os
+import queue
+import re
 import shutil
+import socket
 import subprocess
 import sys
 import threading
 import time
+from collections.abc import Callable, Mapping
+from concurrent.futures import Executor, Future
+from http import HTTPStatus
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Final, ParamSpec, TypeVar
+from urllib.parse import urlsplit
 
+import orjson
 import requests
+import urllib3
 from dotenv import load_dotenv
-from pydantic import BaseModel, HttpUrl
-from pythonjsonlogger.json import JsonFormatter
+from pythonjsonlogger.orjson import OrjsonFormatter
+from requests.adapters import DEFAULT_POOLBLOCK, HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
 
-from gui import TuneDisplayGUI
+if __package__:
+    from .gui import CACHE_DIR, TuneDisplayGUI
+else:  # Run as a script from this directory
+    from gui import CACHE_DIR, TuneDisplayGUI
 
 logger = logging.getLogger()
-logger.setLevel(logging.INFO)
-log_handler = logging.StreamHandler()
-formatter = JsonFormatter()
-log_handler.setFormatter(formatter)
-if not logger.handlers:
+
+_P = ParamSpec("_P")
+_T = TypeVar("_T")
+
+
+class _DaemonExecutor(Executor):
+    """Executor running calls in order on one daemon thread, so a call in flight never holds up exit.
+
+    ThreadPoolExecutor workers are joined when the interpreter exits, which would wait out a slow download.
+    """
+
+    def __init__(self, thread_name: str) -> None:
+        """Create the executor; its thread starts with the first call."""
+        self._thread_name = thread_name
+        self._jobs: queue.SimpleQueue[tuple[Future, Callable[[], Any]] | None] = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._shutdown = False
+
+    def submit(self, fn: Callable[_P, _T], /, *args: _P.args, **kwargs: _P.kwargs) -> Future[_T]:
+        """Queue fn(*args, **kwargs) and return a future for its result."""
+        with self._lock:
+            if self._shutdown:
+                msg = "cannot schedule new calls after shutdown"
+                raise RuntimeError(msg)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=self._thread_name, daemon=True)
+                self._thread.start()
+            future: Future[_T] = Future()
+            self._jobs.put((future, functools.partial(fn, *args, **kwargs)))
+            return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:  # noqa: FBT001, FBT002
+        """Stop taking calls, optionally cancelling queued ones and waiting for the thread to finish."""
+        with self._lock:
+            self._shutdown = True
+            if cancel_futures:
+                while True:
+                    try:
+                        job = self._jobs.get_nowait()
+                    except queue.Empty:
+                        break
+                    if job:
+                        job[0].cancel()
+            self._jobs.put(None)
+        if wait and self._thread is not None:
+            self._thread.join()
+
+    def _run(self) -> None:
+        """Run queued calls until shutdown."""
+        while job := self._jobs.get():
+            future, call = job
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = call()
+            except BaseException as e:  # noqa: BLE001 - handed to the future like ThreadPoolExecutor does
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+
+# Album art downloads run here so the monitor can go straight back to polling.
+# A single worker keeps downloads in order and the art cache single threaded.
+art_download_pool = _DaemonExecutor("album-art-download")
+
+# Longest waits between polls when nothing changes and when polls keep failing (seconds)
+MAX_IDLE_INTERVAL = 30
+MAX_ERROR_INTERVAL = 120
+
+# Downloaded album art is kept between runs, one file per art URL
+ART_CACHE_DIR = CACHE_DIR / "art"
+ART_CACHE_MAX_AGE = 30 * 24 * 60 * 60  # seconds
+ART_CACHE_MAX_BYTES = 100 * 1024 * 1024
+# Names download_album_art gives its files, <sha1 of the URL>.<ext>, and their partial downloads.
+# Nothing else in the art directory is touched, it may be shared with the user's own files.
+_ART_FILE_RE = re.compile(r"[0-9a-f]{40}\.[^.]+(?P<part>\.part)?")
+
+# Fixed fields of the structured playback log events
+PLAYBACK_STARTED_EVENT = MappingProxyType({"event_type": "now_playing_started"})
+PLAYBACK_CHANGED_EVENT = MappingProxyType({"event_type": "now_playing_changed"})
+PLAYBACK_STOPPED_EVENT = MappingProxyType({"event_type": "now_playing_stopped"})
+
+
+def _configure_logging() -> None:
+    """Send JSON logs to stderr, for when this module is run as the application."""
+    if logger.handlers:
+        return
+    logger.setLevel(logging.INFO)
+    log_handler = logging.StreamHandler()
+    # Serialize log records with orjson rather than the stdlib json encoder
+    # An explicit field list, so the formatter doesn't have to work it out for every record
+    log_handler.setFormatter(
+        OrjsonFormatter("%(asctime)s %(levelname)s %(message)s", rename_fields={"levelname": "level"}),
+    )
     logger.addHandler(log_handler)
 
 
+# Command that opens a file in its default application, looked up on PATH once
+_OPENER = "open" if sys.platform == "darwin" else "xdg-open"
+_OPENER_PATH = shutil.which(_OPENER)
+
+
 def open_file(filepath: str) -> None:
     """Open a file with the default application on macOS/Linux."""
-    opener = "open" if sys.platform == "darwin" else "xdg-open"
-    opener_path = shutil.which(opener)
+    opener_path = _OPENER_PATH
 
     if opener_path:
         try:
@@ -51,57 +162,167 @@ def open_file(filepath: str) -> None:
     else:
         logger.warning(
             "Could not find the command '%s' in system PATH. Cannot open %s.",
-            opener,
+            _OPENER,
             filepath,
         )
 
 
-def setup_and_validate() -> tuple[argparse.Namespace, str, str, str]:
+# Unset or example values of the Last.fm settings
+_PLACEHOLDERS = frozenset({None, "", "YOUR_API_KEY", "YOUR_USERNAME"})
+
+_PARSER = argparse.ArgumentParser(description="Fetch Now Playing from Last.fm and optionally display album art.")
+_PARSER.add_argument(
+    "--no-art",
+    action="store_true",
+    help="Disable downloading and displaying album art",
+)
+_PARSER.add_argument(
+    "--interval",
+    type=int,
+    default=5,
+    help="Seconds to wait between checking Last.fm (default: 5)",
+)
+
+
+def setup_and_validate() -> tuple[argparse.Namespace, str, str, Path]:
     """Load config, parse args, and validate required settings."""
     load_dotenv()
 
     api_key = os.environ.get("LASTFM_API_KEY")
     username = os.environ.get("LASTFM_USERNAME")
-    image_filename = os.environ.get("TUNEDISPLAY_IMAGE_FILENAME") or "lastfm_nowplaying_art.png"
+    art_dir = Path(os.environ.get("TUNEDISPLAY_ART_DIR") or ART_CACHE_DIR).expanduser()
 
-    parser = argparse.ArgumentParser(description="Fetch Now Playing from Last.fm and optionally display album art.")
-    parser.add_argument(
-        "--no-art",
-        action="store_true",
-        help="Disable downloading and displaying album art",
-    )
-    parser.add_argument(
-        "--interval",
-        type=int,
-        default=5,
-        help="Seconds to wait between checking Last.fm (default: 5)",
-    )
-    args = parser.parse_args()
+    args = _PARSER.parse_args()
 
-    if not api_key or api_key == "YOUR_API_KEY":
+    if api_key in _PLACEHOLDERS:
         logger.error("Configuration Error: Last.fm API key not found or is placeholder.")
         sys.exit("Please provide LASTFM_API_KEY via .env or environment variable.")
-    if not username or username == "YOUR_USERNAME":
+    if username in _PLACEHOLDERS:
         logger.error("Configuration Error: Last.fm username not found or is placeholder.")
         sys.exit("Please provide LASTFM_USERNAME via .env or environment variable.")
 
-    return args, api_key, username, image_filename
+    return args, api_key, username, art_dir
+
+
+def _remove_cached_art(path: Path) -> bool:
+    """Delete a file from the art cache, returning whether it is gone."""
+    try:
+        path.unlink(missing_ok=True)
+    except OSError:
+        logger.exception("Error removing cached album art %s", path)
+        return False
+    logger.debug("Removed cached album art %s", path)
+    return True
+
+
+def prune_art_cache(art_dir: Path) -> None:
+    """Delete album art unused for ART_CACHE_MAX_AGE, then the least recently used until it fits ART_CACHE_MAX_BYTES.
+
+    Only files named the way download_album_art names them are considered. Partial downloads are left over
+    from an interrupted run, as this runs ahead of the first download, and are always removed.
+    """
+    entries = []
+    for path in art_dir.glob("*"):
+        match = _ART_FILE_RE.fullmatch(path.name)
+        if not match:
+            continue
+        if match["part"]:
+            _remove_cached_art(path)
+            continue
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((st.st_atime, st.st_size, path))
+
+    expire_before = time.time() - ART_CACHE_MAX_AGE
+    total = sum(size for _, size, _ in entries)
+    for last_used, size, path in sorted(entries):
+        if last_used >= expire_before and total <= ART_CACHE_MAX_BYTES:
+            break
+        if _remove_cached_art(path):
+            total -= size
+
+
+# Image ids (file name stems) of the star Last.fm serves for releases without album art
+_PLACEHOLDER_ART_IDS = frozenset({"2a96cbd8b46e442fc41c2b86b821562f"})
 
 
-class Track(BaseModel):
+def _validate_art_url(url: str) -> str | None:
+    """Check an album art URL is an http(s) URL of real art, returning None if it isn't."""
+    # A prefix check is all the downloader needs, a full URL parser costs far more
+    if not url.startswith(("http://", "https://")):
+        logger.warning("Ignoring invalid album art URL: %s", url)
+        return None
+    if Path(urlsplit(url).path).stem in _PLACEHOLDER_ART_IDS:
+        logger.debug("Ignoring placeholder album art: %s", url)
+        return None
+    return url
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Track:
     """Represent a music track."""
 
     artist: str
     name: str
     album: str
-    # Use HttpUrl for validation, Optional if it might be missing
-    art_url: HttpUrl | None = None
+    # Validated with _validate_art_url, None if it is missing
+    art_url: str | None = None
 
     def __str__(self) -> str:
         """Represent a track in string format."""
         art_status = f"URL: {self.art_url}" if self.art_url else "Not available"
         return f"Artist: {self.artist}\nTrack: {self.name}\nAlbum: {self.album}\nAlbum Art: {art_status}"
 
+    @property
+    def as_log_dict(self) -> dict[str, str | None]:
+        """Represent a track as a structured log payload, built once per track."""
+        return _track_log_dict(self)
+
+
+@functools.lru_cache(maxsize=8)
+def _track_log_dict(track: Track) -> dict[str, str | None]:
+    """Build the log payload for a track; cached as the same track is logged more than once."""
+    return {"artist": track.artist, "name": track.name, "album": track.album, "art_url": track.art_url}
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """HTTP adapter whose connections use TCP keepalive as well as urllib3's TCP_NODELAY default."""
+
+    SOCKET_OPTIONS = (
+        *HTTPConnection.default_socket_options,
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    )
+
+    # Same signature as HTTPAdapter.init_poolmanager, so block stays a positional bool
+    def init_poolmanager(
+        self,
+        connections: int,
+        maxsize: int,
+        block: bool = DEFAULT_POOLBLOCK,  # noqa: FBT001
+        **pool_kwargs: object,
+    ) -> None:
+        """Create the pool manager with the extra socket options."""
+        pool_kwargs.setdefault("socket_options", list(self.SOCKET_OPTIONS))
+        super().init_poolmanager(connections, maxsize, block, **pool_kwargs)
+
+
+@functools.cache
+def _get_app_version(app_name: str) -> str:
+    """Look up the installed version of the app once, or 'unknown' when it isn't installed."""
+    # Cached, the metadata lookup scans every installed distribution
+    try:
+        return importlib.metadata.version(app_name)
+    except importlib.metadata.PackageNotFoundError:
+        # Expected when run as a script from the source tree, so no traceback
+        logger.warning("Could not determine package version for %s.", app_name)
+        return "unknown"
+
+
+# Returned by LastFmClient._make_request when the server answered 304 Not Modified
+NOT_MODIFIED: Final = object()
+
 
 class LastFmClient:
     """Client to fetch Now Playing data from Last.fm."""
@@ -109,34 +330,75 @@ class LastFmClient:
     BASE_URL = "http://ws.audioscrobbler.com/2.0/"
     APP_NAME = "TuneDisplay"
     CONTACT_INFO = "https://github.com/soehlert/tunedisplay"
+    # Most preferred first
+    PREFERRED_IMAGE_SIZES = ("mega", "extralarge")
+    NOW_PLAYING_PARAMS: Mapping[str, Any] = MappingProxyType({"method": "user.getrecenttracks", "limit": 1})
 
-    def __init__(self, api_key: str, username: str) -> None:
-        """Initialize a Last.fm client."""
+    def __init__(self, api_key: str, username: str, cache_ttl: float = 0.0) -> None:
+        """Initialize a Last.fm client, reusing now playing results for cache_ttl seconds."""
         if not api_key or not username:
             msg = "API key and username are required."
             raise ValueError(msg)
         self.api_key = api_key
         self.username = username
+        self._base_params = {"api_key": api_key, "user": username, "format": "json"}
+
+        # Looked up on first use rather than at import, so the warning goes through the configured logging
+        self.headers = {"User-Agent": f"{self.APP_NAME}-{_get_app_version(self.APP_NAME)}: {self.CONTACT_INFO}"}
+
+        # One session for every poll and download so the TCP/TLS connection is kept alive
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        adapter = _KeepAliveAdapter(pool_connections=2, pool_maxsize=10, max_retries=retries)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        # Validators of the last response, for conditional requests, and the track parsed from that
+        # response, which is what a 304 Not Modified answer to them stands for
+        self._cached_params: dict[str, Any] | None = None
+        self._etag: str | None = None
+        self._last_modified: str | None = None
+        self._validated_track: Track | None = None
+
+        # Failed requests since the last successful one
+        self._consecutive_errors = 0
+
+        # Short lived now playing result shared by every caller
+        self.cache_ttl = cache_ttl
+        self._now_playing_lock = threading.Lock()
+        self._now_playing: Track | None = None
+        self._now_playing_fetched_at: float | None = None
+
+        # Raw (artist, name, album) of the last track built and the Track itself
+        self._last_signature: tuple[Any, Any, Any] | None = None
+        self._last_track: Track | None = None
+
+    def close(self) -> None:
+        """Close the HTTP session and its pooled connections."""
+        self.session.close()
+
+    def _make_request(self, method_params: Mapping[str, Any]) -> dict[str, Any] | object | None:
+        """Make the API requests, returning NOT_MODIFIED if the last response still applies."""
+        params = self._base_params | method_params
+
+        # Let the server answer 304 Not Modified when nothing changed since the last poll
+        conditional_headers = {}
+        if params == self._cached_params:
+            if self._etag:
+                conditional_headers["If-None-Match"] = self._etag
+            if self._last_modified:
+                conditional_headers["If-Modified-Since"] = self._last_modified
 
         try:
-            app_version = importlib.metadata.version(self.APP_NAME)
-        except importlib.metadata.PackageNotFoundError:
-            app_version = "unknown"
-            logger.exception("Warning: Could not determine package version for %s.", self.APP_NAME)
-
-        user_agent_string = f"{self.APP_NAME}-{app_version}: {self.CONTACT_INFO}"
-        self.headers = {"User-Agent": user_agent_string}
-
-    def _make_request(self, params: dict[str, Any]) -> dict[str, Any] | None:
-        """Make the API requests."""
-        params["api_key"] = self.api_key
-        params["user"] = self.username
-        params["format"] = "json"
-
-        try:
-            response = requests.get(self.BASE_URL, params=params, timeout=5)
+            response = self.session.get(self.BASE_URL, params=params, headers=conditional_headers, timeout=5)
             response.raise_for_status()
-            data = response.json()
+            if response.status_code == HTTPStatus.NOT_MODIFIED:
+                logger.debug("Last.fm response not modified.")
+                self._consecutive_errors = 0
+                return NOT_MODIFIED
+
+            data = orjson.loads(response.content)
             if "error" in data:
                 logger.error(
                     "Last.fm API Error %s: %s",
@@ -144,34 +406,43 @@ class LastFmClient:
                     data.get("message", "No message provided"),
                 )
                 return None
-        except requests.exceptions.RequestException:
-            logger.exception("Error connecting to Last.fm API")
-            return None
-        except json.JSONDecodeError:
-            logger.exception("Error decoding the response from Last.fm API.")
+
+            self._cached_params = params
+            self._etag = response.headers.get("ETag")
+            self._last_modified = response.headers.get("Last-Modified")
+        except (requests.exceptions.RequestException, ValueError) as e:
+            # orjson.JSONDecodeError is a ValueError. Log the traceback for the first of a run of
+            # failures and every tenth after, so an outage doesn't format one on every poll.
+            self._consecutive_errors += 1
+            if self._consecutive_errors % 10 == 1:
+                logger.exception("Error requesting data from Last.fm API")
+            else:
+                logger.warning(
+                    "Error requesting data from Last.fm API (%d in a row): %s",
+                    self._consecutive_errors,
+                    e,
+                )
             return None
         else:
+            self._consecutive_errors = 0
             return data
 
     @staticmethod
     def _extract_image_url(track_data: dict[str, Any]) -> str | None:
-        """Extract the 'extralarge' image URL or the last available one."""
-        art_url: str | None = None
-        image_list: list = track_data.get("image")
-
-        if isinstance(image_list, list) and image_list:
-            for img in image_list:
-                if isinstance(img, dict) and img.get("size") == "extralarge":
-                    art_url = img.get("#text")
-                    if art_url:
-                        break
+        """Extract the 'mega' or else 'extralarge' image URL, or the largest available one."""
+        image_list = track_data.get("image")
+        if not isinstance(image_list, list):
+            return None
 
-            if not art_url:
-                last_image = image_list[-1]
-                if isinstance(last_image, dict):
-                    art_url = last_image.get("#text")
+        url_by_size = {
+            img.get("size"): img["#text"] for img in image_list if isinstance(img, dict) and img.get("#text")
+        }
+        for size in LastFmClient.PREFERRED_IMAGE_SIZES:
+            if size in url_by_size:
+                return url_by_size[size]
 
-        return art_url if art_url else None
+        # Sizes are listed smallest first, so the last one is the largest
+        return next(reversed(url_by_size.values()), None)
 
     def _create_track(self, track_data: dict[str, Any]) -> Track | None:
         """Create a track object."""
@@ -180,7 +451,7 @@ class LastFmClient:
             track_name = track_data.get("name")
             album = track_data.get("album", {}).get("#text")
 
-            if not all([artist, track_name, album]):
+            if not (artist and track_name and album):
                 logger.warning(
                     "Missing essential track data (artist, name, or album) in: %s",
                     track_data,
@@ -188,6 +459,8 @@ class LastFmClient:
                 return None
 
             art_url = self._extract_image_url(track_data)
+            if art_url:
+                art_url = _validate_art_url(art_url)
 
             track_info = {
                 "artist": artist,
@@ -203,152 +476,292 @@ class LastFmClient:
             return None
 
     def get_now_playing(self) -> Track | None:
+        """Return the currently playing track, reusing a result fetched less than cache_ttl ago."""
+        # Fetching while holding the lock makes concurrent callers share a single request
+        with self._now_playing_lock:
+            fetched_at = self._now_playing_fetched_at
+            if fetched_at is not None and time.monotonic() - fetched_at < self.cache_ttl:
+                return self._now_playing
+
+            self._now_playing = self._fetch_now_playing()
+            self._now_playing_fetched_at = time.monotonic()
+            return self._now_playing
+
+    def _fetch_now_playing(self) -> Track | None:
         """Fetch the currently playing track."""
-        params = {
-            "method": "user.getrecenttracks",
-            "limit": 1,
-        }
-        data = self._make_request(params)
-
-        if not data:
+        data = self._make_request(self.NOW_PLAYING_PARAMS)
+        if data is None:
             return None
 
-        try:
-            recent_tracks = data.get("recenttracks", {})
-            track_list = recent_tracks.get("track", [])
+        # A response only comes back with its validators recorded, so keep the track parsed from it
+        # for the 304s to them. A failed poll in between leaves both alone.
+        if data is not NOT_MODIFIED:
+            self._validated_track = self._parse_now_playing(data)
+        return self._validated_track
 
-            if not track_list:
+    def _parse_now_playing(self, data: dict[str, Any]) -> Track | None:
+        """Parse the currently playing track out of a recent tracks response."""
+        try:
+            # Index straight into the response rather than a .get() chain with a default per level
+            try:
+                track_list = data["recenttracks"]["track"]
+                # A lone track can come back as an object rather than a one item list
+                latest_track_data = track_list if isinstance(track_list, dict) else track_list[0]
+            except (KeyError, IndexError):
                 logger.debug("No recent tracks found in Last.fm response.")
                 return None
 
-            latest_track_data = track_list[0]
-
-            attributes = latest_track_data.get("@attr", {})
+            attributes = latest_track_data.get("@attr") or {}
             if not isinstance(attributes, dict) or attributes.get("nowplaying") != "true":
                 logger.debug("Latest track is not marked as 'nowplaying'.")
                 return None
 
-            return self._create_track(latest_track_data)
+            # Most polls return the same track again, so skip building a new Track for it
+            signature = (
+                latest_track_data.get("artist", {}).get("#text"),
+                latest_track_data.get("name"),
+                latest_track_data.get("album", {}).get("#text"),
+            )
+            if signature == self._last_signature:
+                return self._last_track
+
+            track = self._create_track(latest_track_data)
+            if track:
+                self._last_signature = signature
+                self._last_track = track
+            return track
 
-        except (KeyError, IndexError, TypeError):
+        except (AttributeError, KeyError, IndexError, TypeError):
             logger.exception("Error parsing the main Last.fm response structure. Data: %s", data)
             return None
 
-    def download_album_art(self, track: Track, filename: str = "temp_album_art.png") -> str | None:
-        """Download album art for a given track and return the filename."""
+    def download_album_art(self, track: Track, art_dir: Path = ART_CACHE_DIR) -> Path | None:
+        """Download album art for a given track into art_dir, or reuse it from there, and return its path."""
         if not track or not track.art_url:
             logger.info("No album art URL available for this track.")
             return None
 
-        try:
-            img_response = requests.get(str(track.art_url), stream=True, headers=self.headers, timeout=5)
-            img_response.raise_for_status()
-
-            with Path(filename).open("wb") as f:
-                for chunk in img_response.iter_content(1024):
-                    f.write(chunk)
+        # Named after the URL, so art downloaded by this run or an earlier one is found again
+        art_url = str(track.art_url)
+        url_hash = hashlib.sha1(art_url.encode(), usedforsecurity=False).hexdigest()
+        art_path = art_dir / f"{url_hash}{Path(urlsplit(art_url).path).suffix or '.png'}"
 
-            return filename
+        try:
+            st = art_path.stat()
+        except FileNotFoundError:
+            pass
+        else:
+            # Record the use in the access time for prune_art_cache, keeping the mtime the GUI caches on
+            os.utime(art_path, ns=(time.time_ns(), st.st_mtime_ns))
+            logger.debug("Reusing downloaded album art %s", art_path)
+            return art_path
 
-        except requests.exceptions.RequestException:
+        # Download next to the final file and rename it into place, so the GUI never reads half an image
+        part_path = art_path.with_name(f"{art_path.name}.part")
+        try:
+            with self.session.get(art_url, stream=True, timeout=5) as img_response:
+                img_response.raise_for_status()
+
+                # Copy the body in 64 KiB blocks rather than 1 KiB chunks, undoing any gzip on the way
+                img_response.raw.decode_content = True
+                art_dir.mkdir(parents=True, exist_ok=True)
+                with part_path.open("wb") as f:
+                    shutil.copyfileobj(img_response.raw, f, length=65536)
+            part_path.replace(art_path)
+
+        # Reading the raw body raises urllib3's errors (a truncated body, a read timeout) unwrapped by requests
+        except (requests.exceptions.RequestException, urllib3.exceptions.HTTPError):
             logger.exception("Error downloading image")
             return None
         except OSError:
             logger.exception("Error saving image file")
             return None
+        finally:
+            # Gone after a successful rename, otherwise a failed download's leftovers
+            part_path.unlink(missing_ok=True)
+
+        return art_path
+
+
+class _AlbumArtUpdater:
+    """Download album art in the background and show it, unless a later track superseded it."""
+
+    def __init__(self, client: LastFmClient, art_dir: Path, display: TuneDisplayGUI, *, enabled: bool) -> None:
+        """Set up art downloads for the display, or just track changes when enabled is False."""
+        self.client = client
+        self.art_dir = art_dir
+        self.display = display
+        self.enabled = enabled
+        # The monitor thread changes the state below and download callbacks read it on the download thread
+        self._lock = threading.Lock()
+        self._future: Future | None = None
+        # Art URLs of the album art on display and of the download in flight, so tracks sharing them
+        # don't fetch it again
+        self._shown_url: str | None = None
+        self._pending_url: str | None = None
+
+    def update(self, track: Track) -> None:
+        """Download and show the album art of a new track, unless it is already on display or on its way."""
+        if not self.enabled:
+            return
+        if not track.art_url:
+            # No art, or only Last.fm's placeholder, so take the previous track's art down
+            self.clear()
+            return
+
+        art_url = str(track.art_url)
+        with self._lock:
+            if art_url == self._shown_url:
+                logger.debug("Album art unchanged, keeping it", extra={"art_url": art_url})
+                # Drop any download for a track in between, it would replace the art on display
+                self._future = self._pending_url = None
+                return
+            if self._future is not None and not self._future.done() and art_url == self._pending_url:
+                logger.debug("Album art already downloading", extra={"art_url": art_url})
+                return
+
+            logger.info("Attempting to download album art", extra={"art_url": art_url})
+            future = art_download_pool.submit(self.client.download_album_art, track, self.art_dir)
+            self._future, self._pending_url = future, art_url
+        # Outside the lock, as a download that already finished runs the callback right here
+        future.add_done_callback(functools.partial(self._show, art_url=art_url))
+
+    def clear(self) -> None:
+        """Take the album art down and drop any download in flight."""
+        with self._lock:
+            self._future = self._pending_url = self._shown_url = None
+            self.display.clear_album_art()
+
+    def _show(self, future: Future, art_url: str) -> None:
+        """Display a finished download, unless a later track or stopping playback superseded it."""
+        # Cancelled at shutdown, or failed with an error download_album_art doesn't handle
+        if future.cancelled():
+            return
+        if error := future.exception():
+            logger.error("Album art download failed", exc_info=error)
+            return
+
+        art_path = future.result()
+        with self._lock:
+            # Checked and shown together, so clear() can't take the art down in between
+            if future is self._future and art_path:
+                self._shown_url = art_url
+                self.display.update_album_art(art_path)
+
+
+def _show_track_change(
+    previous_track: Track | None,
+    track: Track | None,
+    display: TuneDisplayGUI,
+    art: _AlbumArtUpdater,
+) -> None:
+    """Log a change of the track playing and update the display for it."""
+    if track:
+        if previous_track:
+            log_message, event = "New track playing", PLAYBACK_CHANGED_EVENT
+        else:
+            log_message, event = "Playback started", PLAYBACK_STARTED_EVENT
+        logger.info(log_message, extra={**event, "track_details": track.as_log_dict})
 
+        # Update GUI with track info
+        display.update_song_info(title=track.name, artist=track.artist, album=track.album)
+        art.update(track)
+
+    elif previous_track:
+        logger.info(
+            "Playback stopped",
+            extra={**PLAYBACK_STOPPED_EVENT, "previous_track_details": previous_track.as_log_dict},
+        )
+        # Update GUI to show not playing
+        display.update_song_info()
+        art.clear()
 
-def run_monitoring_loop(client: LastFmClient, args: argparse.Namespace, image_filename: str, display: TuneDisplayGUI) -> None:
+
+def _idle_interval(interval: int, unchanged_polls: int) -> int:
+    """Seconds to wait after unchanged_polls polls in a row found the same track: 1x, 2x, 4x, then 8x interval."""
+    return max(interval, min(interval << min(unchanged_polls, 3), MAX_IDLE_INTERVAL))
+
+
+def run_monitoring_loop(client: LastFmClient, args: argparse.Namespace, art_dir: Path, display: TuneDisplayGUI) -> None:
     """Run the main loop to monitor Last.fm Now Playing status."""
     previous_track: Track | None = None
+    art = _AlbumArtUpdater(client, art_dir, display, enabled=not args.no_art)
+    # Polls in a row that found the same track still playing
+    unchanged_polls = 0
+    current_interval = args.interval
+
     logger.info(
         "Starting continuous monitoring for user %s",
         client.username,
     )
 
-    while display.running:
+    while not display.stop_event.is_set():
         try:
             now_playing_track = client.get_now_playing()
 
             if now_playing_track != previous_track:
-                if now_playing_track:
-                    track_dict = now_playing_track.model_dump(mode="json")
-                    log_message = "New track playing" if previous_track else "Playback started"
-                    event_type = "now_playing_started" if not previous_track else "now_playing_changed"
-                    logger.info(log_message, extra={"event_type": event_type, "track_details": track_dict})
-
-                    # Update GUI with track info
-                    display.update_song_info(
-                        title=now_playing_track.name,
-                        artist=now_playing_track.artist,
-                        album=now_playing_track.album
-                    )
-
-                    if not args.no_art and now_playing_track.art_url:
-                        logger.info(
-                            "Attempting to download album art",
-                            extra={"art_url": str(now_playing_track.art_url)},
-                        )
-                        # Download art and update GUI
-                        art_path = client.download_album_art(now_playing_track, image_filename)
-                        if art_path:
-                            display.update_album_art(art_path)
-
-                elif previous_track:
-                    logger.info(
-                        "Playback stopped",
-                        extra={
-                            "event_type": "now_playing_stopped",
-                            "previous_track_details": previous_track.model_dump(mode="json"),
-                        },
-                    )
-                    # Update GUI to show not playing
-                    display.update_song_info()
-                    display.clear_album_art()
-
+                _show_track_change(previous_track, now_playing_track, display, art)
                 previous_track = now_playing_track
+                # Something changed, so go back to polling at the configured rate
+                unchanged_polls = 0
+                current_interval = args.interval
+            elif now_playing_track is None:
+                # Nothing playing, so keep polling at the configured rate to notice playback start quickly
+                current_interval = args.interval
+            else:
+                # Same track still playing, so poll less often
+                current_interval = _idle_interval(args.interval, unchanged_polls)
+                unchanged_polls += 1
 
         except Exception:
             logger.exception("Error during check cycle")
-            time.sleep(args.interval * 2)
+            current_interval = max(args.interval, min(current_interval * 2, MAX_ERROR_INTERVAL))
 
-        time.sleep(args.interval)
+        # Wakes up as soon as the GUI closes instead of sleeping out the interval
+        if display.stop_event.wait(current_interval):
+            break
 
 
-def cleanup(image_filename: str) -> None:
+def cleanup(client: LastFmClient) -> None:
     """Perform cleanup tasks on shutdown."""
     logger.info("Performing cleanup")
-    if Path(image_filename).exists():
-        try:
-            Path(image_filename).unlink()
-            logger.info("Removed temporary image file: %s", image_filename)
-        except OSError:
-            logger.exception("Error removing temporary image file %s", image_filename)
+    # Don't start queued downloads, and leave one in flight to die with the process
+    art_download_pool.shutdown(wait=False, cancel_futures=True)
+    client.close()
 
-def run_monitoring_thread(client, args, image_filename, gui_display):
+def run_monitoring_thread(client, args, art_dir, gui_display):
     """Run the monitoring loop in a separate thread"""
     threading.Thread(
         target=run_monitoring_loop,
-        args=(client, args, image_filename, gui_display),
+        args=(client, args, art_dir, gui_display),
         daemon=True  # This makes the thread exit when the main program exits
     ).start()
 
 
-if __name__ == "__main__":
-    cli_args, lastfm_api_key, lastfm_username, album_art = setup_and_validate()
+def main() -> None:
+    """Poll Last.fm in the background and show the now playing display."""
+    _configure_logging()
+    cli_args, lastfm_api_key, lastfm_username, art_dir = setup_and_validate()
 
     try:
-        lastfm_client = LastFmClient(api_key=lastfm_api_key, username=lastfm_username)
+        lastfm_client = LastFmClient(
+            api_key=lastfm_api_key,
+            username=lastfm_username,
+            cache_ttl=cli_args.interval / 2,
+        )
     except ValueError:
         logger.exception("Client Initialization Error")
         sys.exit(1)
 
+    # Expire old album art on the download worker, ahead of the first download
+    art_download_pool.submit(prune_art_cache, art_dir)
+
     logger.info("Creating display")
     display = TuneDisplayGUI()
 
     try:
         # Start monitoring in a separate thread
-        run_monitoring_thread(lastfm_client, cli_args, album_art, display)
+        run_monitoring_thread(lastfm_client, cli_args, art_dir, display)
 
         # Start the GUI main loop in the main thread
         display.start()
@@ -356,5 +769,9 @@ if __name__ == "__main__":
     except KeyboardInterrupt:
         logger.info("Stopping monitoring script due to user request.")
     finally:
-        cleanup(album_art)
+        cleanup(lastfm_client)
         sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
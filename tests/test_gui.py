@@ -0,0 +1,24 @@
+"""Tests for the album art rendering helpers."""
+
+import importlib.util
+from unittest import mock
+
+import pytest
+from PIL import Image
+
+from tunedisplay import gui
+
+
+@pytest.mark.skipif(
+    not (importlib.util.find_spec("cykooz_resizer") or importlib.util.find_spec("cykooz")),
+    reason="the display extra's cykooz.resizer isn't installed",
+)
+def test_simd_resizer_is_picked_up_when_installed():
+    """The installed cykooz.resizer is found under either module name and used for RGB art."""
+    assert gui.Resizer is not None
+
+    with mock.patch.object(gui, "_resizer", wraps=gui._resizer) as resizer:
+        img = gui._resize(Image.new("RGB", (400, 300), "red"), (200, 150), Image.Resampling.BILINEAR)
+    resizer.resize_pil.assert_called_once()
+    assert img.size == (200, 150)
+    assert img.getpixel((100, 75)) == (255, 0, 0)
@@ -0,0 +1,228 @@
+"""Tests for the Last.fm client."""
+
+import os
+import threading
+import time
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+from unittest import mock
+
+import orjson
+import pytest
+import requests
+
+from tunedisplay import tunedisplay
+from tunedisplay.tunedisplay import ART_CACHE_MAX_AGE, LastFmClient, Track, prune_art_cache
+
+NOW_PLAYING_BODY = {
+    "recenttracks": {
+        "track": [
+            {
+                "@attr": {"nowplaying": "true"},
+                "artist": {"#text": "Artist"},
+                "name": "Song",
+                "album": {"#text": "Album"},
+                "image": [{"size": "extralarge", "#text": "https://example.com/art/abc.png"}],
+            },
+        ],
+    },
+}
+
+
+def _response(status_code: int, body: dict | None = None, headers: dict | None = None) -> mock.Mock:
+    """Build a stand-in for a requests.Response."""
+    response = mock.Mock(status_code=status_code, headers=headers or {})
+    response.content = orjson.dumps(body) if body is not None else b""
+    return response
+
+
+@pytest.mark.parametrize(
+    "failure",
+    [
+        requests.exceptions.ConnectionError("connection dropped"),
+        _response(200, {"error": 29, "message": "Rate limit exceeded"}),
+    ],
+    ids=["connection-error", "api-error"],
+)
+def test_not_modified_after_failed_poll_returns_validated_track(failure: object):
+    """A 304 stands for the response its validators came from, not a failed poll in between."""
+    client = LastFmClient("key", "user")
+    client.session = mock.Mock()
+    client.session.get.side_effect = [
+        _response(200, NOW_PLAYING_BODY, {"ETag": '"v1"'}),
+        failure,
+        _response(304),
+        _response(304),
+    ]
+
+    expected = Track(artist="Artist", name="Song", album="Album", art_url="https://example.com/art/abc.png")
+    assert client.get_now_playing() == expected
+    assert client.get_now_playing() is None
+    assert client.get_now_playing() == expected
+    assert client.get_now_playing() == expected
+    assert client.session.get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+
+
+def test_prune_art_cache_only_removes_downloaded_art(tmp_path: Path):
+    """Pruning deletes expired art and partial downloads, never files it didn't write."""
+    expired = tmp_path / f"{'a' * 40}.png"
+    recent = tmp_path / f"{'b' * 40}.jpg"
+    partial = tmp_path / f"{'c' * 40}.png.part"
+    unrelated = [tmp_path / ".env", tmp_path / "notes.txt", tmp_path / f"{'d' * 39}.png"]
+    for path in (expired, recent, partial, *unrelated):
+        path.write_bytes(b"x")
+    long_ago = time.time() - ART_CACHE_MAX_AGE - 60
+    for path in (expired, *unrelated):
+        os.utime(path, (long_ago, long_ago))
+
+    prune_art_cache(tmp_path)
+
+    assert not expired.exists()
+    assert not partial.exists()
+    assert recent.exists()
+    assert all(path.exists() for path in unrelated)
+
+
+class _TruncatedImageHandler(BaseHTTPRequestHandler):
+    """Promise a 1000 byte image, then hang up after 10."""
+
+    def do_GET(self) -> None:
+        """Send a short body."""
+        self.send_response(200)
+        self.send_header("Content-Length", "1000")
+        self.end_headers()
+        self.wfile.write(b"x" * 10)
+        self.close_connection = True
+
+    def log_message(self, *args: object) -> None:
+        """Keep test output quiet."""
+
+
+def test_download_album_art_cleans_up_truncated_download(tmp_path: Path):
+    """A body cut short is reported as a failed download and leaves no partial file behind."""
+    server = HTTPServer(("127.0.0.1", 0), _TruncatedImageHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        client = LastFmClient("key", "user")
+        art_url = f"http://127.0.0.1:{server.server_port}/art/abc.png"
+        track = Track(artist="Artist", name="Song", album="Album", art_url=art_url)
+
+        assert client.download_album_art(track, tmp_path) is None
+        assert list(tmp_path.iterdir()) == []
+    finally:
+        server.shutdown()
+
+
+@pytest.fixture
+def downloads(monkeypatch: pytest.MonkeyPatch) -> list[Future]:
+    """Queue album art downloads as futures the test completes itself, in submission order."""
+    futures: list[Future] = []
+
+    def submit(*_args: object) -> Future:
+        futures.append(Future())
+        return futures[-1]
+
+    monkeypatch.setattr(tunedisplay, "art_download_pool", mock.Mock(submit=submit))
+    return futures
+
+
+def _art_updater() -> tuple[tunedisplay._AlbumArtUpdater, mock.Mock]:
+    """Build an album art updater with a stand-in client and display."""
+    display = mock.Mock()
+    return tunedisplay._AlbumArtUpdater(mock.Mock(), Path(), display, enabled=True), display
+
+
+def _track(name: str, art_url: str | None) -> Track:
+    """Build a track with the given art URL."""
+    return Track(artist="Artist", name=name, album="Album", art_url=art_url)
+
+
+def test_track_without_art_takes_previous_art_down(downloads: list[Future]):
+    """Art missing, or only the placeholder, replaces the last album's cover with none."""
+    updater, display = _art_updater()
+    updater.update(_track("one", "https://example.com/art/x.png"))
+    downloads[0].set_result(Path("x.png"))
+
+    updater.update(_track("two", None))
+    display.clear_album_art.assert_called_once()
+
+    # The cover was taken down, so the same art later is fetched and shown again
+    updater.update(_track("three", "https://example.com/art/x.png"))
+    assert len(downloads) == 2
+
+
+def test_superseded_download_is_not_shown(downloads: list[Future]):
+    """Only the latest track's download reaches the display."""
+    updater, display = _art_updater()
+    updater.update(_track("one", "https://example.com/art/x.png"))
+    updater.update(_track("two", "https://example.com/art/y.png"))
+
+    downloads[0].set_result(Path("x.png"))
+    display.update_album_art.assert_not_called()
+    downloads[1].set_result(Path("y.png"))
+    display.update_album_art.assert_called_once_with(Path("y.png"))
+
+
+def test_art_on_display_drops_download_in_between(downloads: list[Future]):
+    """Going back to the art on display keeps it, and the in-between track's download is ignored."""
+    updater, display = _art_updater()
+    updater.update(_track("one", "https://example.com/art/x.png"))
+    downloads[0].set_result(Path("x.png"))
+    updater.update(_track("two", "https://example.com/art/y.png"))
+    updater.update(_track("three", "https://example.com/art/x.png"))
+
+    assert len(downloads) == 2
+    downloads[1].set_result(Path("y.png"))
+    display.update_album_art.assert_called_once_with(Path("x.png"))
+
+
+def test_art_already_downloading_is_not_fetched_again(downloads: list[Future]):
+    """A track sharing the art of the download in flight waits for it, and a failed one is retried."""
+    updater, display = _art_updater()
+    updater.update(_track("one", "https://example.com/art/x.png"))
+    updater.update(_track("two", "https://example.com/art/x.png"))
+    assert len(downloads) == 1
+
+    downloads[0].set_exception(OSError("disk full"))
+    updater.update(_track("three", "https://example.com/art/x.png"))
+    assert len(downloads) == 2
+    downloads[1].set_result(Path("x.png"))
+    display.update_album_art.assert_called_once_with(Path("x.png"))
+
+
+def test_clear_drops_download_in_flight(downloads: list[Future]):
+    """Art finishing after playback stopped isn't shown."""
+    updater, display = _art_updater()
+    updater.update(_track("one", "https://example.com/art/x.png"))
+    updater.clear()
+
+    downloads[0].set_result(Path("x.png"))
+    display.clear_album_art.assert_called_once()
+    display.update_album_art.assert_not_called()
+
+
+def test_daemon_executor_shutdown_cancels_queued_calls():
+    """Shutting down with cancel_futures lets the call in flight finish and cancels the queued ones."""
+    executor = tunedisplay._DaemonExecutor("test-executor")
+    started, release = threading.Event(), threading.Event()
+
+    def blocking() -> str:
+        started.set()
+        release.wait(5)
+        return "done"
+
+    in_flight = executor.submit(blocking)
+    queued = executor.submit(str, "never")
+    assert started.wait(5)
+
+    executor.shutdown(wait=False, cancel_futures=True)
+    assert queued.cancelled()
+    with pytest.raises(RuntimeError):
+        executor.submit(str, "too late")
+
+    release.set()
+    assert in_flight.result(5) == "done"
+    executor.shutdown()
+    assert not executor._thread.is_alive()
+    assert executor._thread.daemon